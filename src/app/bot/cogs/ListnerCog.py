@@ -1,3 +1,5 @@
+import asyncio
+
 from app.bot.utils.logging import get_logger
 from datetime import datetime, timezone
 from typing import Optional
@@ -12,6 +14,11 @@ from ..services.user_registry import UserRegistry
 
 logger = get_logger(__name__)
 
+# Caps in-flight ensure_member calls on guild join so large guilds do not
+# queue thousands of Motor round-trips on the connection pool at once.
+_GUILD_JOIN_CONCURRENCY = 10
+
+
 class ListnerCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
@@ -283,19 +290,32 @@ class ListnerCog(commands.Cog):
 
         logger.info("Joined new guild: %s (ID: %s)", guild.name, guild.id)
 
-        users = {}
-        for member in guild.members:
+        members = [member for member in guild.members if not member.bot]
+        logger.info("Caching %d users for guild join %s", len(members), guild.name)
+        limit = asyncio.Semaphore(_GUILD_JOIN_CONCURRENCY)
 
-            if member.bot:
-                continue
-
-            logger.info("Caching user for guild join %s (ID: %s)", member.name, member.id)
-            user = await self._user_registry.ensure_member(member)
-            users[member.id] = user
+        async def _ensure(member: Member) -> User:
+            async with limit:
+                return await self._user_registry.ensure_member(member)
 
+        # Failed members are logged and skipped so one bad lookup does not
+        # leave the whole guild uncached.
+        ensured = await asyncio.gather(
+            *(_ensure(member) for member in members), return_exceptions=True
+        )
+        users: dict[int, User] = {}
+        for member, result in zip(members, ensured):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Unable to ensure member %s in guild %s: %s",
+                    member.id,
+                    guild.id,
+                    result,
+                )
+                continue
+            users[member.id] = result
             await self.bot.dirty_data.put((guild.id, member.id))
 
-
         db_name = f"{guild.id}"
         g_db = db_client.get_database(db_name)
 
@@ -24,11 +24,16 @@ def _make_client() -> MongoClient:
 
 db_client = _make_client()
 
-try:
-    db_client.admin.command('ping')
-    logger.info("Pinged MongoDB. Connection OK.")
-except Exception as exc:
-    logger.error("MongoDB ping failed: %s", exc)
+
+def ping() -> bool:
+    """Round-trip to the deployment once; called at bot startup, not on import."""
+    try:
+        db_client.admin.command('ping')
+        logger.info("Pinged MongoDB. Connection OK.")
+        return True
+    except Exception as exc:
+        logger.error("MongoDB ping failed: %s", exc)
+        return False
 
 
 def create_db(db_name: str):
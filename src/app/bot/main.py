@@ -12,7 +12,7 @@ from app.infra.serialization import to_bson
 
 from ..domain.models.UserModel import User
 from .config import BOT_FLUSH_VIA_ADAPTER, BOT_TOKEN
-from .database import db_client
+from .database import db_client, ping
 
 
 logger = get_logger(__name__)
@@ -33,6 +33,7 @@ class Nonagon(commands.Bot):
 
     # Called before the bot logins to discord
     async def setup_hook(self):
+        await asyncio.to_thread(ping)
 
         # Load every .py file under the bot/cogs directory as an extension
         cogs_path = Path(__file__).parent / "cogs"
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from itertools import count
+from typing import Dict, Generic, Tuple, TypeVar
+
+import pytest
+
+from app.domain.models.CharacterModel import Character
+from app.domain.models.QuestModel import Quest
+from app.domain.models.UserModel import User
+
+T = TypeVar("T")
+
+
+class _FakeRepo(Generic[T]):
+    """Guild-scoped in-memory store keyed by (guild_id, entity id)."""
+
+    id_prefix = ""
+
+    def __init__(self) -> None:
+        self._store: Dict[Tuple[int, str], T] = {}
+        self._ids = count(1)
+
+    async def next_id(self, guild_id: int) -> str:
+        return f"{self.id_prefix}{next(self._ids):04d}"
+
+    async def get(self, guild_id: int, entity_id: str) -> T | None:
+        return self._store.get((guild_id, entity_id))
+
+    async def delete(self, guild_id: int, entity_id: str) -> bool:
+        return self._store.pop((guild_id, entity_id), None) is not None
+
+
+class _FakeUsersRepo(_FakeRepo[User]):
+    id_prefix = "USER"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._discord_to_user_id: Dict[Tuple[int, str], str] = {}
+
+    async def upsert(self, guild_id: int, user: User) -> bool:
+        key = (guild_id, str(user.user_id))
+        self._store[key] = user
+        if user.discord_id:
+            self._discord_to_user_id[(guild_id, user.discord_id)] = key[1]
+        return True
+
+    async def get_by_discord_id(self, guild_id: int, discord_id: str) -> User | None:
+        user_id = self._discord_to_user_id.get((guild_id, discord_id))
+        user = self._store.get((guild_id, user_id))
+        if user is None or user.discord_id != discord_id:
+            return None
+        return user
+
+    async def delete(self, guild_id: int, user_id: str) -> bool:
+        user = self._store.pop((guild_id, user_id), None)
+        if user is None:
+            return False
+        if user.discord_id:
+            self._discord_to_user_id.pop((guild_id, user.discord_id), None)
+        return True
+
+
+class _FakeQuestsRepo(_FakeRepo[Quest]):
+    id_prefix = "QUES"
+
+    async def upsert(self, guild_id: int, quest: Quest) -> bool:
+        quest.guild_id = guild_id
+        self._store[(guild_id, str(quest.quest_id))] = quest
+        return True
+
+
+class _FakeCharactersRepo(_FakeRepo[Character]):
+    id_prefix = "CHAR"
+
+
+@pytest.fixture
+def fake_users_repo() -> _FakeUsersRepo:
+    return _FakeUsersRepo()
+
+
+@pytest.fixture
+def fake_quests_repo() -> _FakeQuestsRepo:
+    return _FakeQuestsRepo()
+
+
+@pytest.fixture
+def fake_characters_repo() -> _FakeCharactersRepo:
+    return _FakeCharactersRepo()
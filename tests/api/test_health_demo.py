@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List
 
+import pytest
 from fastapi.testclient import TestClient
 
 from app.api.main import app
 from app.api.routers import demo as demo_router
 
+pytestmark = pytest.mark.integration
+
 
 def test_healthz_ok():
     client = TestClient(app)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, Tuple
 
+import pytest
 from fastapi.testclient import TestClient
 
 os.environ.setdefault("MONGODB_URI", "mongodb://localhost/test")
@@ -13,66 +13,29 @@ from app.domain.models.EntityIDModel import CharacterID, QuestID, UserID
 from app.domain.models.QuestModel import PlayerSignUp, Quest
 from app.domain.models.UserModel import User
 
+pytestmark = pytest.mark.integration
 
-class _FakeQuestsRepo:
-    def __init__(self) -> None:
-        self._store: Dict[Tuple[int, str], Quest] = {}
-        self._counter = 1
 
-    async def next_id(self, guild_id: int) -> str:
-        value = f"QUES{self._counter:04d}"
-        self._counter += 1
-        return value
+@pytest.fixture
+def fake_repos(monkeypatch, fake_quests_repo, fake_users_repo, fake_characters_repo):
+    monkeypatch.setattr(quests_router, "quests_repo", fake_quests_repo)
+    monkeypatch.setattr(quests_router, "users_repo", fake_users_repo)
+    monkeypatch.setattr(quests_router, "characters_repo", fake_characters_repo)
 
-    async def upsert(self, guild_id: int, quest: Quest) -> bool:
-        key = (guild_id, str(quest.quest_id))
-        quest.guild_id = guild_id
-        self._store[key] = quest
-        return True
+    return fake_quests_repo, fake_users_repo, fake_characters_repo
 
-    async def get(self, guild_id: int, quest_id: str) -> Quest | None:
-        return self._store.get((guild_id, quest_id))
-
-    async def delete(self, guild_id: int, quest_id: str) -> bool:
-        key = (guild_id, quest_id)
-        if key in self._store:
-            del self._store[key]
-            return True
-        return False
-
-
-class _FakeUsersRepo:
-    def __init__(self) -> None:
-        self._store: Dict[Tuple[int, str], User] = {}
-
-    async def get(self, guild_id: int, user_id: str) -> User | None:
-        return self._store.get((guild_id, user_id))
-
-    async def upsert(self, guild_id: int, user: User) -> bool:
-        self._store[(guild_id, str(user.user_id))] = user
-        return True
-
-
-class _FakeCharactersRepo:
-    def __init__(self) -> None:
-        self._store: Dict[Tuple[int, str], object] = {}
-
-    async def get(self, guild_id: int, character_id: str):
-        return self._store.get((guild_id, character_id))
-
-
-def test_create_quest_uses_existing_id_and_persists(monkeypatch) -> None:
-    fake_quests = _FakeQuestsRepo()
-    fake_users = _FakeUsersRepo()
-    fake_characters = _FakeCharactersRepo()
-
-    monkeypatch.setattr(quests_router, "quests_repo", fake_quests)
-    monkeypatch.setattr(quests_router, "users_repo", fake_users)
-    monkeypatch.setattr(quests_router, "characters_repo", fake_characters)
 
+@pytest.fixture
+def referee(fake_repos) -> User:
+    _, fake_users, _ = fake_repos
     referee = User(user_id=UserID(1), guild_id=123)
     referee.enable_referee()
     fake_users._store[(123, str(referee.user_id))] = referee
+    return referee
+
+
+def test_create_quest_uses_existing_id_and_persists(fake_repos, referee) -> None:
+    fake_quests, _, _ = fake_repos
 
     client = TestClient(app)
 
@@ -98,19 +61,7 @@ def test_create_quest_uses_existing_id_and_persists(monkeypatch) -> None:
     assert stored.duration.total_seconds() == 2 * 3600
 
 
-def test_create_quest_requires_channel_and_raw(monkeypatch) -> None:
-    fake_quests = _FakeQuestsRepo()
-    fake_users = _FakeUsersRepo()
-    fake_characters = _FakeCharactersRepo()
-
-    monkeypatch.setattr(quests_router, "quests_repo", fake_quests)
-    monkeypatch.setattr(quests_router, "users_repo", fake_users)
-    monkeypatch.setattr(quests_router, "characters_repo", fake_characters)
-
-    referee = User(user_id=UserID(1), guild_id=123)
-    referee.enable_referee()
-    fake_users._store[(123, str(referee.user_id))] = referee
-
+def test_create_quest_requires_channel_and_raw(referee) -> None:
     client = TestClient(app)
 
     response = client.post(
@@ -127,14 +78,9 @@ def test_create_quest_requires_channel_and_raw(monkeypatch) -> None:
     assert "channel_id" in response.json()["detail"]
 
 
-def _setup_signup_env(monkeypatch):
-    fake_quests = _FakeQuestsRepo()
-    fake_users = _FakeUsersRepo()
-    fake_characters = _FakeCharactersRepo()
-
-    monkeypatch.setattr(quests_router, "quests_repo", fake_quests)
-    monkeypatch.setattr(quests_router, "users_repo", fake_users)
-    monkeypatch.setattr(quests_router, "characters_repo", fake_characters)
+@pytest.fixture
+def signup_env(fake_repos):
+    fake_quests, fake_users, fake_characters = fake_repos
 
     quest = Quest(
         quest_id=QuestID.parse("QUES0001"),
@@ -158,8 +104,8 @@ def _setup_signup_env(monkeypatch):
     return fake_quests, fake_users, fake_characters, quest, player, character_id
 
 
-def test_add_signup_persists_request(monkeypatch) -> None:
-    fake_quests, _, _, quest, player, character_id = _setup_signup_env(monkeypatch)
+def test_add_signup_persists_request(signup_env) -> None:
+    fake_quests, _, _, quest, player, character_id = signup_env
     client = TestClient(app)
 
     response = client.post(
@@ -178,8 +124,8 @@ def test_add_signup_persists_request(monkeypatch) -> None:
     assert signup.character_id == character_id
 
 
-def test_add_signup_duplicate_returns_friendly_message(monkeypatch) -> None:
-    fake_quests, _, _, quest, player, character_id = _setup_signup_env(monkeypatch)
+def test_add_signup_duplicate_returns_friendly_message(signup_env) -> None:
+    fake_quests, _, _, quest, player, character_id = signup_env
     quest.signups.append(
         PlayerSignUp(user_id=player.user_id, character_id=character_id)
     )
@@ -198,8 +144,8 @@ def test_add_signup_duplicate_returns_friendly_message(monkeypatch) -> None:
     assert response.json()["detail"] == "You already requested to join this quest."
 
 
-def test_nudge_updates_timestamp_and_enforces_cooldown(monkeypatch) -> None:
-    fake_quests, fake_users, _, quest, _, _ = _setup_signup_env(monkeypatch)
+def test_nudge_updates_timestamp_and_enforces_cooldown(signup_env) -> None:
+    fake_quests, fake_users, _, quest, _, _ = signup_env
     referee = User(user_id=quest.referee_id, guild_id=quest.guild_id)
     referee.enable_referee()
     fake_users._store[(quest.guild_id, str(referee.user_id))] = referee
@@ -4,6 +4,8 @@ import sys
 from pathlib import Path
 from typing import Any, Dict
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[2]
 SRC_PATH = ROOT / "src"
 if str(SRC_PATH) not in sys.path:
@@ -20,6 +22,8 @@ from app.infra.mongo.guild_adapter import (  # noqa: E402
 )
 from app.infra.serialization import from_bson, to_bson  # noqa: E402
 
+pytestmark = pytest.mark.fast
+
 
 class _FakeCollection:
     def __init__(self):
@@ -61,9 +65,39 @@ class _FakeClient:
         return self._db
 
 
-def test_upsert_user_sync_builds_filter():
+@pytest.fixture(scope="module")
+def sample_user() -> User:
+    return User(user_id=UserID(42))
+
+
+@pytest.fixture(scope="module")
+def sample_quest() -> Quest:
+    return Quest(
+        quest_id=QuestID(7),
+        guild_id=123,
+        referee_id=UserID(1),
+        channel_id="0",
+        message_id="0",
+        raw="x",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_character() -> Character:
+    return Character(
+        character_id="CHAR0003",
+        owner_id=UserID(1),
+        name="N",
+        ddb_link="d",
+        character_thread_link="t",
+        token_link="k",
+        art_link="a",
+    )
+
+
+def test_upsert_user_sync_builds_filter(sample_user):
     client = _FakeClient()
-    user = User(user_id=UserID(42))
+    user = sample_user
     upsert_user_sync(client, guild_id=123, user=user)
     filt, doc, upsert = client._db._users.last
     assert filt == {"guild_id": 123, "user_id.value": str(user.user_id)}
@@ -71,21 +105,14 @@ def test_upsert_user_sync_builds_filter():
     payload = doc["$set"]
     assert payload["user_id"]["value"] == str(user.user_id)
     assert payload["guild_id"] == 123
-    index_keys = [keys for keys, _ in client._db._users.indexes]
+    index_keys = {keys for keys, _ in client._db._users.indexes}
     assert (("guild_id", 1), ("user_id.value", 1)) in index_keys
     assert (("guild_id", 1), ("discord_id", 1)) in index_keys
 
 
-def test_upsert_quest_sync_builds_filter():
+def test_upsert_quest_sync_builds_filter(sample_quest):
     client = _FakeClient()
-    q = Quest(
-        quest_id=QuestID(7),
-        guild_id=123,
-        referee_id=UserID(1),
-        channel_id="0",
-        message_id="0",
-        raw="x",
-    )
+    q = sample_quest
     upsert_quest_sync(client, guild_id=123, quest=q)
     filt, doc, upsert = client._db._quests.last
     assert filt == {"guild_id": 123, "quest_id.value": str(q.quest_id)}
@@ -93,29 +120,21 @@ def test_upsert_quest_sync_builds_filter():
     payload = doc["$set"]
     assert payload["quest_id"]["value"] == str(q.quest_id)
     assert payload["guild_id"] == 123
-    quest_indexes = [keys for keys, _ in client._db._quests.indexes]
+    quest_indexes = {keys for keys, _ in client._db._quests.indexes}
     assert (("guild_id", 1), ("quest_id.value", 1)) in quest_indexes
     assert (("guild_id", 1), ("channel_id", 1), ("message_id", 1)) in quest_indexes
 
 
-def test_upsert_character_sync_builds_filter():
+def test_upsert_character_sync_builds_filter(sample_character):
     client = _FakeClient()
-    c = Character(
-        character_id="CHAR0003",
-        owner_id=UserID(1),
-        name="N",
-        ddb_link="d",
-        character_thread_link="t",
-        token_link="k",
-        art_link="a",
-    )
+    c = sample_character
     upsert_character_sync(client, guild_id=123, character=c)
     filt, doc, upsert = client._db._characters.last
     assert filt == {"guild_id": 123, "character_id": c.character_id}
     assert upsert is True
     payload = doc["$set"]
     assert payload["guild_id"] == 123
-    char_indexes = [keys for keys, _ in client._db._characters.indexes]
+    char_indexes = {keys for keys, _ in client._db._characters.indexes}
     assert (("guild_id", 1), ("character_id", 1)) in char_indexes
     assert (("guild_id", 1), ("owner_id.value", 1)) in char_indexes
 
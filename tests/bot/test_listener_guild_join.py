@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.bot.cogs import ListnerCog as listner_cog
+from app.bot.cogs.ListnerCog import ListnerCog
+
+
+class _FakeUserRegistry:
+    def __init__(self, failing_ids: frozenset[int] = frozenset()) -> None:
+        self.ensured: list[int] = []
+        self.failing_ids = failing_ids
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ensure_member(self, member):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if member.id in self.failing_ids:
+                raise RuntimeError("lookup failed")
+            self.ensured.append(member.id)
+            return SimpleNamespace(discord_id=str(member.id))
+        finally:
+            self.in_flight -= 1
+
+
+def _guild(member_ids, bot_ids=()):
+    return SimpleNamespace(
+        id=123,
+        name="Guild",
+        members=[SimpleNamespace(id=member_id, bot=True) for member_id in bot_ids]
+        + [SimpleNamespace(id=member_id, bot=False) for member_id in member_ids],
+    )
+
+
+@pytest.mark.parametrize("human_ids", [[1], [1, 3], list(range(1, 11))])
+async def test_guild_join_caches_humans_and_skips_bots(human_ids) -> None:
+    bot = SimpleNamespace(dirty_data=asyncio.Queue(), guild_data={})
+    cog = ListnerCog(bot)
+    registry = _FakeUserRegistry()
+    cog._user_registry = registry
+
+    await cog._on_guild_join(_guild(human_ids, bot_ids=[999]))
+
+    assert registry.ensured == human_ids
+    users = bot.guild_data[123]["users"]
+    assert {member_id: user.discord_id for member_id, user in users.items()} == {
+        member_id: str(member_id) for member_id in human_ids
+    }
+    queued = [bot.dirty_data.get_nowait() for _ in range(bot.dirty_data.qsize())]
+    assert queued == [(123, member_id) for member_id in human_ids]
+
+
+async def test_guild_join_caps_concurrent_member_lookups() -> None:
+    bot = SimpleNamespace(dirty_data=asyncio.Queue(), guild_data={})
+    cog = ListnerCog(bot)
+    registry = _FakeUserRegistry()
+    cog._user_registry = registry
+
+    await cog._on_guild_join(_guild(range(1, 51)))
+
+    assert len(bot.guild_data[123]["users"]) == 50
+    assert registry.max_in_flight == listner_cog._GUILD_JOIN_CONCURRENCY
+
+
+async def test_guild_join_skips_members_that_fail_to_ensure() -> None:
+    bot = SimpleNamespace(dirty_data=asyncio.Queue(), guild_data={})
+    cog = ListnerCog(bot)
+    cog._user_registry = _FakeUserRegistry(failing_ids=frozenset({2}))
+
+    await cog._on_guild_join(_guild([1, 2, 3]))
+
+    assert set(bot.guild_data[123]["users"]) == {1, 3}
+    queued = [bot.dirty_data.get_nowait() for _ in range(bot.dirty_data.qsize())]
+    assert queued == [(123, 1), (123, 3)]
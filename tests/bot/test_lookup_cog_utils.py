@@ -2,9 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import pytest
+
 from app.bot.cogs.LookupCommandsCog import _build_lookup_embed
 from app.domain.models.LookupModel import LookupEntry
 
+pytestmark = pytest.mark.fast
+
 
 def test_build_lookup_embed_includes_timestamp() -> None:
     entry = LookupEntry(
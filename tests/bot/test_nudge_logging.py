@@ -12,8 +12,10 @@ from app.bot.cogs.QuestCommandsCog import QuestCommandsCog
 from app.domain.models.EntityIDModel import QuestID, UserID
 from app.domain.models.QuestModel import Quest
 
+_NOW = datetime(2030, 1, 1, tzinfo=timezone.utc)
 
-@pytest_asyncio.fixture
+
+@pytest_asyncio.fixture(scope="module")
 async def bot():
     intents = discord.Intents.none()
     client = commands.Bot(command_prefix="!", intents=intents)
@@ -23,7 +25,13 @@ async def bot():
         await client.close()
 
 
-def _build_quest() -> Quest:
+@pytest.fixture(scope="module")
+def cog(bot) -> QuestCommandsCog:
+    return QuestCommandsCog(bot)
+
+
+@pytest.fixture(scope="module")
+def quest() -> Quest:
     return Quest(
         quest_id=QuestID.parse("QUES0001"),
         guild_id=123,
@@ -33,16 +41,14 @@ def _build_quest() -> Quest:
         raw="Quest body",
         title="Golden Apple",
         description="Retrieve the golden apple.",
-        starting_at=datetime.now(timezone.utc) + timedelta(days=1),
+        starting_at=_NOW + timedelta(days=1),
     )
 
 
-def test_build_nudge_embed_includes_jump_link(bot):
-    cog = QuestCommandsCog(bot)
-    quest = _build_quest()
+def test_build_nudge_embed_includes_jump_link(cog, quest):
     member = SimpleNamespace(mention="@Ref")
     jump_url = "https://discord.com/channels/123/456/789"
-    bumped_at = datetime.now(timezone.utc)
+    bumped_at = _NOW
 
     embed = cog._build_nudge_embed(quest, member, jump_url, bumped_at=bumped_at)
 
@@ -52,15 +58,13 @@ def test_build_nudge_embed_includes_jump_link(bot):
     assert f"Quest ID: {quest.quest_id}" in embed.footer.text
 
 
-@pytest.mark.asyncio
-async def test_emit_nudge_log_invokes_demo_log(bot):
-    cog = QuestCommandsCog(bot)
+async def test_emit_nudge_log_invokes_demo_log(bot, cog, monkeypatch):
     calls: list[tuple] = []
 
     async def fake_demo_log(bot_arg, guild_arg, message):
         calls.append((bot_arg, guild_arg, message))
 
-    cog._demo_log = fake_demo_log
+    monkeypatch.setattr(cog, "_demo_log", fake_demo_log)
 
     guild = SimpleNamespace(id=123)
     member = SimpleNamespace(mention="@Ref")
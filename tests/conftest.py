@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+from app.infra import db
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not built for Windows
+    uvloop = None
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests and fixtures on uvloop when it is installed."""
+    if uvloop is None:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(autouse=True)
+def mongo_client(monkeypatch) -> AsyncMongoMockClient:
+    """Back every repo with an in-process mongomock client instead of a live server."""
+    client = AsyncMongoMockClient()
+    monkeypatch.setattr(db, "_client", client)
+    return client
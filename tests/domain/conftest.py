@@ -4,7 +4,7 @@ from datetime import datetime
 from app.domain.models.EntityIDModel import UserID, QuestID, CharacterID, SummaryID
 from app.domain.models.UserModel import User, Player, Referee, Role
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def now():
     return datetime(2030, 1, 1, 12, 0, 0)
 
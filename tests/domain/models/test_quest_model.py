@@ -53,8 +53,8 @@ def test_status_helpers_and_properties(now):
     assert q.last_nudged_at is None
 
 
-def test_add_and_select_signup():
-    q = make_quest(datetime.now())
+def test_add_and_select_signup(now):
+    q = make_quest(now)
     uid = UserID(1)
     cid = CharacterID(1)
 
@@ -71,8 +71,8 @@ def test_add_and_select_signup():
     assert q.signups[0].status.name == "SELECTED"
 
 
-def test_remove_signup_removes_player():
-    q = make_quest(datetime.now())
+def test_remove_signup_removes_player(now):
+    q = make_quest(now)
     uid = UserID(1)
     q.add_signup(uid, CharacterID(1))
     q.remove_signup(uid)
@@ -1,10 +1,12 @@
 import pytest
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import timedelta
 from app.domain.models.SummaryModel import QuestSummary, SummaryKind
 from app.domain.models.EntityIDModel import UserID, CharacterID, QuestID, SummaryID
 
 
-def make_summary(now: datetime) -> QuestSummary:
+@pytest.fixture(scope="module")
+def base_summary(now) -> QuestSummary:
     return QuestSummary(
         summary_id=SummaryID(1),
         kind=SummaryKind.PLAYER,
@@ -20,25 +22,30 @@ def make_summary(now: datetime) -> QuestSummary:
     )
 
 
-def test_validate_summary_happy(now):
-    s = make_summary(now)
+@pytest.fixture
+def make_summary(base_summary):
+    def _make(**overrides) -> QuestSummary:
+        return replace(base_summary, **overrides)
+
+    return _make
+
+
+def test_validate_summary_happy(make_summary):
+    s = make_summary()
     s.validate_summary()  # should not raise
 
 
-def test_validate_summary_requires_players_and_characters(now):
-    s = make_summary(now)
-    s.players = []
+def test_validate_summary_requires_players_and_characters(make_summary):
+    s = make_summary(players=[])
     with pytest.raises(ValueError):
         s.validate_summary()
 
-    s = make_summary(now)
-    s.characters = []
+    s = make_summary(characters=[])
     with pytest.raises(ValueError):
         s.validate_summary()
 
 
-def test_last_edited_cannot_precede_created(now):
-    s = make_summary(now)
-    s.last_edited_at = now - timedelta(days=1)
+def test_last_edited_cannot_precede_created(make_summary, now):
+    s = make_summary(last_edited_at=now - timedelta(days=1))
     with pytest.raises(ValueError):
         s.validate_summary()
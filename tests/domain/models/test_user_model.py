@@ -20,16 +20,23 @@ def test_defaults_and_roles(base_user: User):
     base_user.validate_user()
 
 
-def test_enable_player_sets_profile(base_user: User):
-    base_user.enable_player()
-    assert base_user.is_player is True
-    assert base_user.player is not None
-
-
-def test_enable_referee_sets_profile(base_user: User):
-    base_user.enable_referee()
-    assert base_user.is_referee is True
-    assert base_user.referee is not None
+@pytest.mark.parametrize(
+    "enable, flag, profile, profile_cls",
+    [
+        (User.enable_player, "is_player", "player", Player),
+        (User.enable_referee, "is_referee", "referee", Referee),
+    ],
+    ids=["player", "referee"],
+)
+def test_enable_sets_profile_once(base_user: User, enable, flag, profile, profile_cls):
+    enable(base_user)
+    assert getattr(base_user, flag) is True
+    first = getattr(base_user, profile)
+    assert isinstance(first, profile_cls)
+
+    enable(base_user)
+    assert getattr(base_user, profile) is first
+    assert len(base_user.roles) == len(set(base_user.roles))
 
 
 def test_is_character_owner_when_player(player_user: User):
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-import pytest
-
 from app.domain.models.EntityIDModel import UserID
 from app.domain.models.UserModel import User
 from app.domain.usecase.unit.user_unit import update_user_last_active_async
@@ -21,7 +19,6 @@ class _FakeAsyncUsersRepo:
         self._saved = user
 
 
-@pytest.mark.asyncio
 async def test_update_last_active_async_updates_timestamp():
     uid = UserID(1)
     u = User(user_id=uid, guild_id=777)
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List
 
 import pytest
 
 from app.domain.models.LookupModel import LookupEntry
 from app.infra.mongo import lookup_repo
 
+_CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+_GUIDE_ENTRIES = (
+    LookupEntry(guild_id=1, name="Guide", url="https://example.com/guide", created_by=1),
+    LookupEntry(guild_id=1, name="Guidelines", url="https://example.com/guidelines", created_by=1),
+)
+
 
 class _FakeCursor:
     def __init__(self, docs: List[Dict[str, Any]]):
@@ -25,38 +34,36 @@ class _FakeCursor:
 
 class _FakeCollection:
     def __init__(self):
-        self._docs: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        # guild_id -> name_normalized -> doc, so find() only touches one guild
+        self._docs: Dict[int, Dict[str, Dict[str, Any]]] = defaultdict(dict)
         self.last_find_one_and_update = None
         self.last_delete = None
         self.last_find_one = None
 
     async def find_one_and_update(self, filt, update, upsert=False, return_document=None):
         self.last_find_one_and_update = (filt, update, upsert, return_document)
-        key = (filt["guild_id"], filt["name_normalized"])
-        doc = update["$set"].copy()
-        existing = self._docs.get(key)
+        guild_docs = self._docs[filt["guild_id"]]
+        existing = guild_docs.get(filt["name_normalized"])
         if existing is None:
-            self._docs[key] = doc
+            existing = guild_docs[filt["name_normalized"]] = dict(update["$set"])
         else:
-            existing.update(doc)
-            doc = existing
-        return doc
+            existing.update(update["$set"])
+        return existing
 
     async def find_one(self, filt):
         self.last_find_one = filt
-        key = (filt["guild_id"], filt["name_normalized"])
-        return self._docs.get(key)
+        return self._docs.get(filt["guild_id"], {}).get(filt["name_normalized"])
 
     def find(self, filt, projection):  # projection unused in fake
-        guild_id = filt.get("guild_id")
-        docs = [doc for (gid, _), doc in self._docs.items() if gid == guild_id]
-        return _FakeCursor(docs)
+        return _FakeCursor(self._docs.get(filt.get("guild_id"), {}).values())
 
     async def delete_one(self, filt):
         self.last_delete = filt
-        key = (filt["guild_id"], filt["name_normalized"])
-        existed = key in self._docs
-        self._docs.pop(key, None)
+        guild_docs = self._docs.get(filt["guild_id"], {})
+        existed = guild_docs.pop(filt["name_normalized"], None) is not None
 
         class _Result:
             deleted_count = 1 if existed else 0
@@ -64,12 +71,23 @@ class _FakeCollection:
         return _Result()
 
 
-@pytest.mark.asyncio
-async def test_upsert_scopes_by_guild(monkeypatch):
-    repo = lookup_repo.LookupRepoMongo()
-    fake = _FakeCollection()
-    monkeypatch.setattr(lookup_repo, "COLL", lambda guild_id: fake)
+@pytest.fixture(scope="module")
+def repo() -> lookup_repo.LookupRepoMongo:
+    return lookup_repo.LookupRepoMongo()
+
+
+@pytest.fixture(scope="module")
+def fake_coll() -> _FakeCollection:
+    return _FakeCollection()
+
+
+@pytest.fixture(autouse=True)
+def _use_fake_coll(fake_coll, monkeypatch) -> None:
+    fake_coll.reset()
+    monkeypatch.setattr(lookup_repo, "COLL", lambda guild_id: fake_coll)
 
+
+async def test_upsert_scopes_by_guild(repo, fake_coll):
     entry = LookupEntry(
         guild_id=321,
         name="Staff Guide",
@@ -78,49 +96,33 @@ async def test_upsert_scopes_by_guild(monkeypatch):
     )
     saved = await repo.upsert(entry)
 
-    filt, update, upsert, _ = fake.last_find_one_and_update
+    filt, update, upsert, _ = fake_coll.last_find_one_and_update
     assert filt == {"guild_id": 321, "name_normalized": "staff guide"}
     assert update["$set"]["guild_id"] == 321
     assert upsert is True
     assert saved.name == "Staff Guide"
 
 
-@pytest.mark.asyncio
-async def test_get_by_name_uses_normalized_key(monkeypatch):
-    repo = lookup_repo.LookupRepoMongo()
-    fake = _FakeCollection()
-    fake._docs[(123, "faq")] = {
+async def test_get_by_name_uses_normalized_key(repo, fake_coll):
+    fake_coll._docs[123]["faq"] = {
         "guild_id": 123,
         "name": "FAQ",
         "name_normalized": "faq",
         "url": "https://example.com/faq",
         "created_by": 1,
-        "created_at": LookupEntry(
-            guild_id=123,
-            name="FAQ",
-            url="https://example.com/faq",
-            created_by=1,
-        ).created_at,
+        "created_at": _CREATED_AT,
     }
-    monkeypatch.setattr(lookup_repo, "COLL", lambda guild_id: fake)
 
     result = await repo.get_by_name(123, "FAQ")
 
-    assert fake.last_find_one == {"guild_id": 123, "name_normalized": "faq"}
+    assert fake_coll.last_find_one == {"guild_id": 123, "name_normalized": "faq"}
     assert result is not None
     assert result.url == "https://example.com/faq"
 
 
-@pytest.mark.asyncio
-async def test_find_best_match_prefers_exact(monkeypatch):
-    repo = lookup_repo.LookupRepoMongo()
-    entries = [
-        LookupEntry(guild_id=1, name="Guide", url="https://example.com/guide", created_by=1),
-        LookupEntry(guild_id=1, name="Guidelines", url="https://example.com/guidelines", created_by=1),
-    ]
-
+async def test_find_best_match_prefers_exact(repo, monkeypatch):
     async def _list_all(_guild_id: int):
-        return entries
+        return _GUIDE_ENTRIES
 
     monkeypatch.setattr(repo, "list_all", _list_all)
 
@@ -130,26 +132,36 @@ async def test_find_best_match_prefers_exact(monkeypatch):
     assert result.name == "Guide"
 
 
-@pytest.mark.asyncio
-async def test_delete_returns_bool(monkeypatch):
-    repo = lookup_repo.LookupRepoMongo()
-    fake = _FakeCollection()
-    fake._docs[(1, "guide")] = {
+async def test_list_all_returns_only_that_guild_sorted(repo):
+    for guild_id, name in [(1, "Rules"), (2, "Maps"), (1, "Bestiary"), (2, "Calendar")]:
+        await repo.upsert(
+            LookupEntry(
+                guild_id=guild_id,
+                name=name,
+                url=f"https://example.com/{name.lower()}",
+                created_by=1,
+            )
+        )
+
+    guild_one = await repo.list_all(1)
+    guild_two = await repo.list_all(2)
+
+    assert [entry.name for entry in guild_one] == ["Bestiary", "Rules"]
+    assert [entry.name for entry in guild_two] == ["Calendar", "Maps"]
+    assert await repo.list_all(3) == []
+
+
+async def test_delete_returns_bool(repo, fake_coll):
+    fake_coll._docs[1]["guide"] = {
         "guild_id": 1,
         "name": "Guide",
         "name_normalized": "guide",
         "url": "https://example.com/guide",
         "created_by": 1,
-        "created_at": LookupEntry(
-            guild_id=1,
-            name="Guide",
-            url="https://example.com/guide",
-            created_by=1,
-        ).created_at,
+        "created_at": _CREATED_AT,
     }
-    monkeypatch.setattr(lookup_repo, "COLL", lambda guild_id: fake)
 
     deleted = await repo.delete(1, "Guide")
 
     assert deleted is True
-    assert fake.last_delete == {"guild_id": 1, "name_normalized": "guide"}
+    assert fake_coll.last_delete == {"guild_id": 1, "name_normalized": "guide"}
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import types
 
-import pytest
-
 from app.domain.models.EntityIDModel import QuestID, UserID
 from app.domain.models.QuestModel import Quest
 from app.infra.mongo import quests_repo
@@ -18,7 +16,6 @@ class _FakeCollection:
         return types.SimpleNamespace()
 
 
-@pytest.mark.asyncio
 async def test_quests_repo_upsert_scopes_by_guild(monkeypatch):
     repo = quests_repo.QuestsRepoMongo()
     fake = _FakeCollection()
@@ -30,9 +30,12 @@ class _FakeCollection:
         }
 
 
-@pytest.mark.asyncio
-async def test_users_repo_upsert_scopes_by_guild(monkeypatch):
-    repo = users_repo.UsersRepoMongo()
+@pytest.fixture(scope="module")
+def repo() -> users_repo.UsersRepoMongo:
+    return users_repo.UsersRepoMongo()
+
+
+async def test_users_repo_upsert_scopes_by_guild(repo, monkeypatch):
     fake = _FakeCollection()
     monkeypatch.setattr(users_repo, "COLL", lambda guild_id: fake)
 
@@ -45,9 +48,7 @@ async def test_users_repo_upsert_scopes_by_guild(monkeypatch):
     assert upsert is True
 
 
-@pytest.mark.asyncio
-async def test_users_repo_get_by_discord_id_filters_guild(monkeypatch):
-    repo = users_repo.UsersRepoMongo()
+async def test_users_repo_get_by_discord_id_filters_guild(repo, monkeypatch):
     fake = _FakeCollection()
     monkeypatch.setattr(users_repo, "COLL", lambda guild_id: fake)
 